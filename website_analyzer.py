@@ -1,9 +1,11 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
+import aiohttp
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, urljoin
 from collections import Counter
 import re
@@ -16,8 +18,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS, built once at import; st.html skips the markdown pipeline
+_CSS = """
     <style>
     .main > div {
         padding-top: 2rem;
@@ -37,106 +39,631 @@ st.markdown("""
         border-bottom: 3px solid #4CAF50;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+st.html(_CSS)
+
+# Keyword extraction constants
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+                        'of', 'with', 'is', 'was', 'are', 'be', 'been', 'have', 'has', 'had',
+                        'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
+                        'this', 'that', 'these', 'those', 'it', 'its', 'from', 'by', 'as'})
+_WORD_RE = re.compile(r'[A-Za-z]{4,}')
+
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# Subtrees that never contribute visible text
+_STRIP_XPATH = '//script | //style | //noscript | //svg | //template'
+
+# Shared HTTP session so repeated fetches reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': 'gzip, deflate, br'
+})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Bound how much of a page we download; a truncated tail still parses fine
+_MAX_FETCH_BYTES = 8 << 20
+_FETCH_CHUNK_SIZE = 65536
 
 # Helper Functions
-@st.cache_data(ttl=3600)
+@st.cache_data(ttl=3600, persist="disk", max_entries=64, show_spinner=False)
 def fetch_website(url):
-    """Fetch website content"""
+    """Fetch website content as raw bytes"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
         start_time = time.time()
-        response = requests.get(url, headers=headers, timeout=10)
+        with _SESSION.get(url, timeout=10, stream=True) as response:
+            if response.status_code != 200:
+                return None, None
+
+            content = bytearray()
+            for chunk in response.iter_content(_FETCH_CHUNK_SIZE):
+                content.extend(chunk)
+                if len(content) > _MAX_FETCH_BYTES:
+                    break
         load_time = time.time() - start_time
-        
-        if response.status_code == 200:
-            return response, load_time
-        else:
-            return None, None
+
+        return bytes(content), load_time
     except Exception as e:
         st.error(f"Error fetching website: {str(e)}")
         return None, None
 
-def extract_meta_tags(soup):
-    """Extract meta tags"""
-    meta_data = {}
-    
-    title = soup.find('title')
-    meta_data['title'] = title.text.strip() if title else "No title found"
+def extract_all(root, base_url):
+    """Extract meta tags, headings, links and images in a single DOM pass"""
+    meta_data = {
+        'title': "No title found",
+        'description': "No description found",
+        'meta_keywords': "No keywords found",
+        'og_title': "Not set",
+        'og_description': "Not set"
+    }
+    headings = {tag: [] for tag in _HEADING_TAGS}
+    internal_links = set()
+    external_links = set()
+    total_images = 0
+    images_with_alt = 0
+
+    base_domain = urlparse(base_url).netloc
+
+    for el in root.iter():
+        name = el.tag
+        if not isinstance(name, str):
+            # comments and processing instructions have non-string tags
+            continue
+
+        if name in headings:
+            headings[name].append(el.text_content().strip())
+        elif name == 'a':
+            href = el.get('href')
+            if href and not href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
+                if href.startswith(('http://', 'https://')):
+                    # fast netloc slice: between '://' and the next '/'
+                    full_url = href
+                    start = href.find('://') + 3
+                    end = href.find('/', start)
+                    netloc = href[start:] if end == -1 else href[start:end]
+                else:
+                    full_url = urljoin(base_url, href)
+                    netloc = urlparse(full_url).netloc
+                if netloc == base_domain or netloc == '':
+                    internal_links.add(full_url)
+                else:
+                    external_links.add(full_url)
+        elif name == 'img':
+            total_images += 1
+            if el.get('alt'):
+                images_with_alt += 1
+        elif name == 'meta':
+            content = el.get('content')
+            if content:
+                key = el.get('name') or el.get('property')
+                if key == 'description':
+                    meta_data['description'] = content
+                elif key == 'keywords':
+                    meta_data['meta_keywords'] = content
+                elif key == 'og:title':
+                    meta_data['og_title'] = content
+                elif key == 'og:description':
+                    meta_data['og_description'] = content
+        elif name == 'title' and meta_data['title'] == "No title found":
+            title_text = el.text_content().strip()
+            if title_text:
+                meta_data['title'] = title_text
+
     meta_data['title_length'] = len(meta_data['title'])
-    
-    desc = soup.find('meta', attrs={'name': 'description'})
-    meta_data['description'] = desc['content'] if desc and desc.get('content') else "No description found"
     meta_data['description_length'] = len(meta_data['description'])
-    
-    keywords = soup.find('meta', attrs={'name': 'keywords'})
-    meta_data['meta_keywords'] = keywords['content'] if keywords and keywords.get('content') else "No keywords found"
-    
-    og_title = soup.find('meta', property='og:title')
-    meta_data['og_title'] = og_title['content'] if og_title and og_title.get('content') else "Not set"
-    
-    og_desc = soup.find('meta', property='og:description')
-    meta_data['og_description'] = og_desc['content'] if og_desc and og_desc.get('content') else "Not set"
-    
-    return meta_data
-
-def extract_headings(soup):
-    """Extract heading tags"""
-    headings = {}
-    for i in range(1, 7):
-        tags = soup.find_all(f'h{i}')
-        headings[f'h{i}'] = [tag.text.strip() for tag in tags]
-    return headings
-
-def extract_keywords(text, top_n=20):
-    """Extract top keywords from text"""
-    text = re.sub(r'[^a-zA-Z\s]', '', text.lower())
-    
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                  'of', 'with', 'is', 'was', 'are', 'be', 'been', 'have', 'has', 'had',
-                  'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
-                  'this', 'that', 'these', 'those', 'it', 'its', 'from', 'by', 'as'}
-    
-    words = [word for word in text.split() if word not in stop_words and len(word) > 3]
-    word_freq = Counter(words)
-    
-    return word_freq.most_common(top_n)
 
-def analyze_links(soup, base_url):
-    """Analyze internal and external links"""
-    links = soup.find_all('a', href=True)
-    internal_links = []
-    external_links = []
-    
-    base_domain = urlparse(base_url).netloc
-    
-    for link in links:
-        href = link['href']
-        full_url = urljoin(base_url, href)
-        parsed = urlparse(full_url)
-        
-        if parsed.netloc == base_domain or parsed.netloc == '':
-            internal_links.append(full_url)
-        else:
-            external_links.append(full_url)
-    
-    return internal_links, external_links
-
-def analyze_images(soup):
-    """Analyze images"""
-    images = soup.find_all('img')
-    total_images = len(images)
-    images_with_alt = sum(1 for img in images if img.get('alt'))
-    images_without_alt = total_images - images_with_alt
-    
-    return {
+    image_data = {
         'total': total_images,
         'with_alt': images_with_alt,
-        'without_alt': images_without_alt
+        'without_alt': total_images - images_with_alt
+    }
+
+    return meta_data, headings, sorted(internal_links), sorted(external_links), image_data
+
+def extract_text_stats(root):
+    """Stream visible text node by node, dropping script/style subtrees first.
+
+    Returns (word_freq, word_count, text_length) from a single pass; the full
+    page text is never joined into one string, so peak memory stays at
+    vocabulary size rather than page size.
+    """
+    for el in root.xpath(_STRIP_XPATH):
+        el.drop_tree()
+
+    word_freq = Counter()
+    word_count = 0
+    text_length = 0
+    for chunk in root.itertext():
+        words = chunk.split()
+        if not words:
+            continue
+        word_count += len(words)
+        text_length += sum(map(len, words)) + len(words)
+        # Count every token in C, stop words are dropped once at the end
+        word_freq.update(map(str.lower, _WORD_RE.findall(chunk)))
+
+    for word in STOP_WORDS & word_freq.keys():
+        del word_freq[word]
+
+    return word_freq, word_count, text_length
+
+async def _fetch_async(session, url):
+    """Fetch one URL inside an aiohttp session"""
+    try:
+        start_time = time.time()
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status != 200:
+                return url, None, None
+            content = await response.content.read(_MAX_FETCH_BYTES)
+            return url, content, time.time() - start_time
+    except Exception:
+        return url, None, None
+
+async def fetch_many(urls):
+    """Fetch several URLs concurrently, overlapping their network waits"""
+    headers = {'User-Agent': _SESSION.headers['User-Agent']}
+    async with aiohttp.ClientSession(headers=headers) as session:
+        return await asyncio.gather(*[_fetch_async(session, url) for url in urls])
+
+def _analyze_content(url, content, load_time):
+    """Parse fetched bytes and extract everything the report needs.
+
+    Pure function of its arguments, so batch mode can run it on worker
+    threads; lxml releases the GIL while parsing.
+    """
+    root = lxml.html.fromstring(content)
+    meta_data, headings, internal_links, external_links, image_data = extract_all(root, url)
+    word_freq, word_count, text_length = extract_text_stats(root)
+    keywords = word_freq.most_common(20)
+
+    checks = {
+        "Title tag present": meta_data['title'] != "No title found",
+        "Title length optimal": 30 <= meta_data['title_length'] <= 60,
+        "Meta description present": meta_data['description'] != "No description found",
+        "Description length optimal": 120 <= meta_data['description_length'] <= 160,
+        "SSL enabled": url.startswith('https'),
+        "Images have alt tags": image_data['with_alt'] > image_data['total'] * 0.7 if image_data['total'] > 0 else False
+    }
+
+    return {
+        'meta_data': meta_data,
+        'checks': checks,
+        'seo_score': (sum(checks.values()) / len(checks)) * 100,
+        'headings': headings,
+        'heading_counts': {tag: len(texts) for tag, texts in headings.items() if texts},
+        'keywords': keywords,
+        'internal_link_count': len(internal_links),
+        'external_link_count': len(external_links),
+        # The UI only ever shows counts and a sample; keeping full link lists
+        # for big sites would pin MBs per cached URL for the whole TTL
+        'internal_links': internal_links[:500],
+        'external_links': external_links[:500],
+        'image_data': image_data,
+        'word_count': word_count,
+        'load_time': load_time,
+        # Tiny JSON error pages and JS-only shells return 200 with no real text
+        'thin_content': text_length < 200
     }
 
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def analyze_website(url):
+    """Run the full fetch + parse + extraction pipeline, cached per URL"""
+    content, load_time = fetch_website(url)
+    if not content:
+        return None
+
+    return _analyze_content(url, content, load_time)
+
+# Cached figure builders: reruns with unchanged data reuse the serialized figure.
+# pandas/plotly are imported lazily so the welcome screen doesn't pay their
+# ~1-2s import cost on cold start; Python caches them after the first analysis.
+@st.cache_data(ttl=3600, max_entries=64)
+def _build_keyword_fig(keywords):
+    import plotly.graph_objects as go
+
+    words, freqs = zip(*keywords)
+    fig = go.Figure(go.Bar(
+        x=freqs, y=words,
+        orientation='h',
+        marker=dict(color=freqs, colorscale='Viridis')
+    ))
+    fig.update_layout(title='Top 20 Keywords by Frequency', height=600,
+                      yaxis={'categoryorder': 'total ascending'})
+    return fig
+
+@st.cache_data(ttl=3600, max_entries=64)
+def _build_heading_bar(heading_counts):
+    import plotly.graph_objects as go
+
+    tags, counts = zip(*heading_counts)
+    fig = go.Figure(go.Bar(
+        x=tags, y=counts,
+        marker=dict(color=counts, colorscale='Blues')
+    ))
+    fig.update_layout(title='Heading Tags Distribution')
+    return fig
+
+@st.cache_data(ttl=3600, max_entries=64)
+def _build_gauge_fig(seo_score):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=seo_score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "SEO Score"},
+        delta={'reference': 70},
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "#4CAF50" if seo_score >= 70 else "#FF9800"},
+            'steps': [
+                {'range': [0, 40], 'color': "#FFEBEE"},
+                {'range': [40, 70], 'color': "#FFF3E0"},
+                {'range': [70, 100], 'color': "#E8F5E9"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 70
+            }
+        }
+    ))
+    fig.update_layout(height=300)
+    return fig
+
+@st.cache_data(ttl=3600, max_entries=64)
+def _build_stats_bar(stats):
+    import pandas as pd
+    import plotly.express as px
+
+    df_stats = pd.DataFrame(stats, columns=['Metric', 'Count'])
+    fig = px.bar(df_stats, x='Count', y='Metric', orientation='h',
+                color='Count', color_continuous_scale='Greens')
+    fig.update_layout(height=300, showlegend=False)
+    return fig
+
+@st.cache_data(ttl=3600, max_entries=64)
+def _build_link_pie(internal_count, external_count):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=[go.Pie(
+        labels=['Internal Links', 'External Links'],
+        values=[internal_count, external_count],
+        hole=.4,
+        marker_colors=['#3498db', '#e74c3c']
+    )])
+    fig.update_layout(title='Link Distribution', height=400)
+    return fig
+
+@st.cache_data(ttl=3600, max_entries=64)
+def _build_alt_pie(with_alt, without_alt):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=[go.Pie(
+        labels=['With Alt Text', 'Without Alt Text'],
+        values=[with_alt, without_alt],
+        marker_colors=['#2ecc71', '#e74c3c']
+    )])
+    fig.update_layout(title='Image Alt Text Coverage', height=350)
+    return fig
+
+# Section renderers: st.fragment scopes reruns triggered by widgets inside a
+# section to that section, instead of re-executing the whole script
+@st.fragment
+def render_overview(data, checks, seo_score, website_url):
+    image_data = data['image_data']
+
+    st.header("Quick Metrics Overview")
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        st.metric(
+            "SEO Score",
+            f"{seo_score:.0f}%",
+            delta="Good" if seo_score >= 70 else "Needs Work",
+            delta_color="normal" if seo_score >= 70 else "inverse"
+        )
+
+    with col2:
+        st.metric(
+            "Page Load Time",
+            f"{data['load_time']:.2f}s",
+            delta="Fast" if data['load_time'] < 3 else "Slow",
+            delta_color="normal" if data['load_time'] < 3 else "inverse"
+        )
+
+    with col3:
+        st.metric("Total Words", f"{data['word_count']:,}")
+
+    with col4:
+        st.metric("Total Images", image_data['total'])
+
+    with col5:
+        ssl_status = "🔒 Secure" if website_url.startswith('https') else "⚠️ Insecure"
+        st.metric("SSL Status", ssl_status)
+
+    st.markdown("---")
+
+    # Visual metrics
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("SEO Health Score")
+        st.plotly_chart(_build_gauge_fig(seo_score), use_container_width=True)
+
+    with col2:
+        st.subheader("Quick Stats")
+
+        total_headings = sum(data['heading_counts'].values())
+        total_links = data['internal_link_count'] + data['external_link_count']
+
+        stats = (
+            ('Total Headings', total_headings),
+            ('Total Links', total_links),
+            ('Internal Links', data['internal_link_count']),
+            ('External Links', data['external_link_count']),
+            ('Images with Alt', image_data['with_alt']),
+            ('Images without Alt', image_data['without_alt'])
+        )
+        st.plotly_chart(_build_stats_bar(stats), use_container_width=True)
+
+@st.fragment
+def render_seo_analysis(meta_data, checks, seo_score):
+    st.header("🎯 SEO Analysis")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.subheader("Meta Tags Analysis")
+
+        # Title analysis
+        title_status = "✅" if 30 <= meta_data['title_length'] <= 60 else "⚠️"
+        st.markdown(f"**Title Tag** {title_status}")
+        st.info(meta_data['title'])
+        st.caption(f"Length: {meta_data['title_length']} characters (Optimal: 30-60)")
+
+        st.markdown("---")
+
+        # Description analysis
+        desc_status = "✅" if 120 <= meta_data['description_length'] <= 160 else "⚠️"
+        st.markdown(f"**Meta Description** {desc_status}")
+        st.info(meta_data['description'])
+        st.caption(f"Length: {meta_data['description_length']} characters (Optimal: 120-160)")
+
+        st.markdown("---")
+
+        # Meta keywords
+        st.markdown("**Meta Keywords**")
+        st.info(meta_data['meta_keywords'])
+
+        st.markdown("---")
+
+        # Open Graph
+        st.markdown("**Open Graph Tags**")
+        col_og1, col_og2 = st.columns(2)
+        with col_og1:
+            st.text("OG Title:")
+            st.caption(meta_data['og_title'])
+        with col_og2:
+            st.text("OG Description:")
+            st.caption(meta_data['og_description'])
+
+    with col2:
+        st.subheader("SEO Checklist")
+
+        for check, passed in checks.items():
+            icon = "✅" if passed else "❌"
+            color = "green" if passed else "red"
+            st.markdown(f":{color}[{icon} {check}]")
+
+        st.markdown("---")
+        st.metric("Overall SEO Score", f"{seo_score:.0f}%")
+
+        if seo_score >= 80:
+            st.success("Excellent SEO!")
+        elif seo_score >= 60:
+            st.warning("Good, but can improve")
+        else:
+            st.error("Needs improvement")
+
+@st.fragment
+def render_keywords(keywords, website_name):
+    import pandas as pd
+
+    st.header("🔑 Keyword Analysis")
+
+    if keywords:
+        df_keywords = pd.DataFrame(keywords, columns=['Keyword', 'Frequency'])
+
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            st.subheader("Top Keywords Visualization")
+            st.plotly_chart(_build_keyword_fig(tuple(keywords)), use_container_width=True)
+
+        with col2:
+            st.subheader("Keyword Data")
+            st.dataframe(df_keywords, use_container_width=True, height=600)
+
+            # Download button
+            csv = df_keywords.to_csv(index=False)
+            st.download_button(
+                label="📥 Download Keywords CSV",
+                data=csv,
+                file_name=f"{website_name}_keywords.csv",
+                mime="text/csv"
+            )
+    else:
+        st.warning("No keywords extracted")
+
+@st.fragment
+def render_content(headings, heading_counts):
+    st.header("📝 Content Structure")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Heading Distribution")
+
+        if heading_counts:
+            st.plotly_chart(_build_heading_bar(tuple(heading_counts.items())), use_container_width=True)
+        else:
+            st.warning("No heading tags found")
+
+    with col2:
+        st.subheader("H1 Tags")
+        if headings['h1']:
+            for i, h1 in enumerate(headings['h1'][:10], 1):
+                st.markdown(f"**{i}.** {h1}")
+        else:
+            st.warning("⚠️ No H1 tags found (Bad for SEO)")
+
+    st.markdown("---")
+
+    # All headings expansion
+    with st.expander("🔍 View All Headings"):
+        for tag in _HEADING_TAGS:
+            if headings[tag]:
+                st.markdown(f"### {tag.upper()} Tags ({len(headings[tag])})")
+                for i, heading in enumerate(headings[tag][:20], 1):
+                    st.text(f"{i}. {heading}")
+                st.markdown("---")
+
+@st.fragment
+def render_links_images(internal_count, external_count, image_data):
+    st.header("🔗 Links & Images Analysis")
+
+    # Links section
+    st.subheader("Links Analysis")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Total Links", internal_count + external_count)
+
+    with col2:
+        st.metric("Internal Links", internal_count)
+
+    with col3:
+        st.metric("External Links", external_count)
+
+    # Links pie chart
+    st.plotly_chart(_build_link_pie(internal_count, external_count), use_container_width=True)
+
+    st.markdown("---")
+
+    # Images section
+    st.subheader("🖼️ Image Analysis")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.metric("Total Images", image_data['total'])
+        st.metric("Images with Alt Text", image_data['with_alt'])
+        st.metric("Images without Alt Text", image_data['without_alt'])
+
+        if image_data['without_alt'] > 0:
+            st.warning(f"⚠️ {image_data['without_alt']} images missing alt text")
+
+    with col2:
+        st.plotly_chart(_build_alt_pie(image_data['with_alt'], image_data['without_alt']), use_container_width=True)
+
+@st.fragment
+def render_recommendations(meta_data, headings, image_data, load_time, website_url):
+    st.header("💡 Recommendations & Action Items")
+
+    recommendations = []
+
+    if not (30 <= meta_data['title_length'] <= 60):
+        recommendations.append({
+            'priority': 'High',
+            'category': 'SEO',
+            'issue': 'Title Tag Length',
+            'recommendation': 'Optimize title tag length to 30-60 characters for better search visibility'
+        })
+
+    if not (120 <= meta_data['description_length'] <= 160):
+        recommendations.append({
+            'priority': 'High',
+            'category': 'SEO',
+            'issue': 'Meta Description Length',
+            'recommendation': 'Optimize meta description to 120-160 characters'
+        })
+
+    if not headings['h1']:
+        recommendations.append({
+            'priority': 'Critical',
+            'category': 'Content',
+            'issue': 'Missing H1 Tags',
+            'recommendation': 'Add H1 tags to your pages - crucial for SEO'
+        })
+
+    if image_data['without_alt'] > 0:
+        recommendations.append({
+            'priority': 'Medium',
+            'category': 'Accessibility',
+            'issue': f'{image_data["without_alt"]} Images Without Alt Text',
+            'recommendation': 'Add descriptive alt text to all images for better SEO and accessibility'
+        })
+
+    if load_time > 3:
+        recommendations.append({
+            'priority': 'High',
+            'category': 'Performance',
+            'issue': 'Slow Page Load Time',
+            'recommendation': 'Optimize page load time to under 3 seconds (consider image compression, caching, CDN)'
+        })
+
+    if not website_url.startswith('https'):
+        recommendations.append({
+            'priority': 'Critical',
+            'category': 'Security',
+            'issue': 'No SSL Certificate',
+            'recommendation': 'Implement SSL certificate (HTTPS) immediately for security and SEO'
+        })
+
+    if recommendations:
+        # Priority filter
+        priority_filter = st.multiselect(
+            "Filter by Priority",
+            options=['Critical', 'High', 'Medium', 'Low'],
+            default=['Critical', 'High', 'Medium', 'Low']
+        )
+
+        # Display recommendations
+        for rec in recommendations:
+            if rec['priority'] not in priority_filter:
+                continue
+
+            if rec['priority'] == 'Critical':
+                st.error(f"🚨 **{rec['priority']}** - {rec['category']}: {rec['issue']}")
+            elif rec['priority'] == 'High':
+                st.warning(f"⚠️ **{rec['priority']}** - {rec['category']}: {rec['issue']}")
+            else:
+                st.info(f"ℹ️ **{rec['priority']}** - {rec['category']}: {rec['issue']}")
+
+            st.markdown(f"*Recommendation:* {rec['recommendation']}")
+            st.markdown("---")
+
+        # Summary
+        st.subheader("Summary")
+        priority_counts = Counter(rec['priority'] for rec in recommendations)
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("Critical Issues", priority_counts['Critical'])
+
+        with col2:
+            st.metric("High Priority", priority_counts['High'])
+
+        with col3:
+            st.metric("Medium Priority", priority_counts['Medium'])
+
+    else:
+        st.success("🎉 Excellent! Your website follows all major SEO best practices!")
+        st.balloons()
+
 def get_domain_name(url):
     """Extract clean domain name from URL"""
     parsed = urlparse(url)
@@ -150,6 +677,10 @@ if 'analyzed' not in st.session_state:
     st.session_state.analyzed = False
 if 'website_name' not in st.session_state:
     st.session_state.website_name = ""
+if 'analyzed_url' not in st.session_state:
+    st.session_state.analyzed_url = ""
+if 'analysis_cache' not in st.session_state:
+    st.session_state.analysis_cache = {}
 
 # Sidebar
 with st.sidebar:
@@ -163,10 +694,19 @@ with st.sidebar:
     )
     
     analyze_button = st.button("🚀 Analyze Website", type="primary", use_container_width=True)
-    
+
     if st.session_state.analyzed:
         st.success(f"✅ Analyzing: **{st.session_state.website_name}**")
-    
+
+    st.markdown("---")
+    st.markdown("### ⚡ Batch Analyze")
+    batch_urls_text = st.text_area(
+        "One URL per line",
+        placeholder="https://example.com\nhttps://example.org",
+        help="Fetches all URLs concurrently and shows a quick summary per site"
+    )
+    batch_button = st.button("⚡ Analyze Batch", use_container_width=True)
+
     st.markdown("---")
     st.markdown("### 📊 Features:")
     st.markdown("""
@@ -182,6 +722,47 @@ with st.sidebar:
     st.markdown("---")
     st.caption("Built with Streamlit 🎈")
 
+# Batch analysis
+if batch_button:
+    batch_urls = [u.strip() for u in batch_urls_text.splitlines() if u.strip()]
+    if not batch_urls:
+        st.error("Please enter at least one URL to batch analyze")
+    else:
+        with st.spinner(f"🔄 Fetching {len(batch_urls)} websites concurrently..."):
+            batch_results = asyncio.run(fetch_many(batch_urls))
+
+            # Parse on worker threads; lxml releases the GIL so pages overlap
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = {url: pool.submit(_analyze_content, url, content, load_time)
+                           for url, content, load_time in batch_results if content}
+                analyses = {url: future.result() for url, future in futures.items()}
+
+        st.title("⚡ Batch Analysis")
+        batch_tabs = st.tabs([get_domain_name(url) for url in batch_urls])
+
+        for tab, (url, content, load_time) in zip(batch_tabs, batch_results):
+            with tab:
+                st.markdown(f"**URL:** `{url}`")
+                site = analyses.get(url)
+                if site is None:
+                    st.error("Could not fetch this website")
+                    continue
+
+                col1, col2, col3, col4, col5 = st.columns(5)
+                with col1:
+                    st.metric("Load Time", f"{site['load_time']:.2f}s")
+                with col2:
+                    st.metric("Total Words", f"{site['word_count']:,}")
+                with col3:
+                    st.metric("Total Images", site['image_data']['total'])
+                with col4:
+                    st.metric("Internal Links", site['internal_link_count'])
+                with col5:
+                    st.metric("External Links", site['external_link_count'])
+
+                st.markdown(f"**Title:** {site['meta_data']['title']}")
+                st.caption(site['meta_data']['description'])
+
 # Main content
 if not st.session_state.analyzed and not analyze_button:
     # Welcome screen
@@ -216,437 +797,71 @@ if analyze_button:
         st.error("Please enter a valid URL")
     else:
         with st.spinner("🔄 Analyzing website... This may take a moment..."):
-            response, load_time = fetch_website(website_url)
-            
-            if response:
+            data = analyze_website(website_url)
+
+            if data:
+                if data['thin_content']:
+                    st.warning("⚠️ Page appears empty or JavaScript-rendered - not enough content to analyze")
+                    st.stop()
+
                 # Extract website name
                 st.session_state.website_name = get_domain_name(website_url)
                 st.session_state.analyzed = True
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract data
-                meta_data = extract_meta_tags(soup)
-                headings = extract_headings(soup)
-                text_content = soup.get_text()
-                keywords = extract_keywords(text_content)
-                internal_links, external_links = analyze_links(soup, website_url)
-                image_data = analyze_images(soup)
-                
+                st.session_state.analyzed_url = website_url
+                st.session_state.analysis_cache[website_url] = data
+
                 st.success("✅ Analysis Complete!")
 
 if st.session_state.analyzed:
     # Dynamic title with website name
     st.title(f"📊 {st.session_state.website_name} Website Analysis")
-    st.markdown(f"**Analyzing:** `{website_url}`")
+    analyzed_url = st.session_state.analyzed_url
+    st.markdown(f"**Analyzing:** `{analyzed_url}`")
     st.markdown("---")
-    
-    # Recreate data (from cache if available)
-    response, load_time = fetch_website(website_url)
-    if response:
-        soup = BeautifulSoup(response.content, 'html.parser')
-        meta_data = extract_meta_tags(soup)
-        headings = extract_headings(soup)
-        text_content = soup.get_text()
-        keywords = extract_keywords(text_content)
-        internal_links, external_links = analyze_links(soup, website_url)
-        image_data = analyze_images(soup)
-        
-        # Calculate SEO score
-        score = 0
-        total_checks = 6
-        checks = {
-            "Title tag present": meta_data['title'] != "No title found",
-            "Title length optimal": 30 <= meta_data['title_length'] <= 60,
-            "Meta description present": meta_data['description'] != "No description found",
-            "Description length optimal": 120 <= meta_data['description_length'] <= 160,
-            "SSL enabled": website_url.startswith('https'),
-            "Images have alt tags": image_data['with_alt'] > image_data['total'] * 0.7 if image_data['total'] > 0 else False
-        }
-        for check, passed in checks.items():
-            if passed:
-                score += 1
-        seo_score = (score / total_checks) * 100
-        
-        # Create tabs for better organization
-        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-            "📊 Overview", 
-            "🎯 SEO Analysis", 
-            "🔑 Keywords", 
-            "📝 Content", 
-            "🔗 Links & Images",
-            "💡 Recommendations"
-        ])
-        
-        # TAB 1: OVERVIEW
-        with tab1:
-            st.header("Quick Metrics Overview")
-            
-            col1, col2, col3, col4, col5 = st.columns(5)
-            
-            with col1:
-                st.metric(
-                    "SEO Score", 
-                    f"{seo_score:.0f}%",
-                    delta="Good" if seo_score >= 70 else "Needs Work",
-                    delta_color="normal" if seo_score >= 70 else "inverse"
-                )
-            
-            with col2:
-                st.metric(
-                    "Page Load Time", 
-                    f"{load_time:.2f}s",
-                    delta="Fast" if load_time < 3 else "Slow",
-                    delta_color="normal" if load_time < 3 else "inverse"
-                )
-            
-            with col3:
-                st.metric("Total Words", f"{len(text_content.split()):,}")
-            
-            with col4:
-                st.metric("Total Images", image_data['total'])
-            
-            with col5:
-                ssl_status = "🔒 Secure" if website_url.startswith('https') else "⚠️ Insecure"
-                st.metric("SSL Status", ssl_status)
-            
-            st.markdown("---")
-            
-            # Visual metrics
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("SEO Health Score")
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number+delta",
-                    value=seo_score,
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    title={'text': "SEO Score"},
-                    delta={'reference': 70},
-                    gauge={
-                        'axis': {'range': [None, 100]},
-                        'bar': {'color': "#4CAF50" if seo_score >= 70 else "#FF9800"},
-                        'steps': [
-                            {'range': [0, 40], 'color': "#FFEBEE"},
-                            {'range': [40, 70], 'color': "#FFF3E0"},
-                            {'range': [70, 100], 'color': "#E8F5E9"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': 70
-                        }
-                    }
-                ))
-                fig.update_layout(height=300)
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                st.subheader("Quick Stats")
-                
-                heading_counts = {tag: len(content) for tag, content in headings.items() if content}
-                total_headings = sum(heading_counts.values())
-                total_links = len(internal_links) + len(external_links)
-                
-                stats_data = {
-                    'Metric': ['Total Headings', 'Total Links', 'Internal Links', 'External Links', 'Images with Alt', 'Images without Alt'],
-                    'Count': [
-                        total_headings,
-                        total_links,
-                        len(internal_links),
-                        len(external_links),
-                        image_data['with_alt'],
-                        image_data['without_alt']
-                    ]
-                }
-                df_stats = pd.DataFrame(stats_data)
-                
-                fig = px.bar(df_stats, x='Count', y='Metric', orientation='h',
-                            color='Count', color_continuous_scale='Greens')
-                fig.update_layout(height=300, showlegend=False)
-                st.plotly_chart(fig, use_container_width=True)
-        
-        # TAB 2: SEO ANALYSIS
-        with tab2:
-            st.header("🎯 SEO Analysis")
-            
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                st.subheader("Meta Tags Analysis")
-                
-                # Title analysis
-                title_status = "✅" if 30 <= meta_data['title_length'] <= 60 else "⚠️"
-                st.markdown(f"**Title Tag** {title_status}")
-                st.info(meta_data['title'])
-                st.caption(f"Length: {meta_data['title_length']} characters (Optimal: 30-60)")
-                
-                st.markdown("---")
-                
-                # Description analysis
-                desc_status = "✅" if 120 <= meta_data['description_length'] <= 160 else "⚠️"
-                st.markdown(f"**Meta Description** {desc_status}")
-                st.info(meta_data['description'])
-                st.caption(f"Length: {meta_data['description_length']} characters (Optimal: 120-160)")
-                
-                st.markdown("---")
-                
-                # Meta keywords
-                st.markdown("**Meta Keywords**")
-                st.info(meta_data['meta_keywords'])
-                
-                st.markdown("---")
-                
-                # Open Graph
-                st.markdown("**Open Graph Tags**")
-                col_og1, col_og2 = st.columns(2)
-                with col_og1:
-                    st.text("OG Title:")
-                    st.caption(meta_data['og_title'])
-                with col_og2:
-                    st.text("OG Description:")
-                    st.caption(meta_data['og_description'])
-            
-            with col2:
-                st.subheader("SEO Checklist")
-                
-                for check, passed in checks.items():
-                    icon = "✅" if passed else "❌"
-                    color = "green" if passed else "red"
-                    st.markdown(f":{color}[{icon} {check}]")
-                
-                st.markdown("---")
-                st.metric("Overall SEO Score", f"{seo_score:.0f}%")
-                
-                if seo_score >= 80:
-                    st.success("Excellent SEO!")
-                elif seo_score >= 60:
-                    st.warning("Good, but can improve")
-                else:
-                    st.error("Needs improvement")
-        
-        # TAB 3: KEYWORDS
-        with tab3:
-            st.header("🔑 Keyword Analysis")
-            
-            if keywords:
-                df_keywords = pd.DataFrame(keywords, columns=['Keyword', 'Frequency'])
-                
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    st.subheader("Top Keywords Visualization")
-                    fig = px.bar(df_keywords, x='Frequency', y='Keyword', 
-                                orientation='h',
-                                title='Top 20 Keywords by Frequency',
-                                color='Frequency',
-                                color_continuous_scale='Viridis')
-                    fig.update_layout(height=600, yaxis={'categoryorder':'total ascending'})
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    st.subheader("Keyword Data")
-                    st.dataframe(df_keywords, use_container_width=True, height=600)
-                    
-                    # Download button
-                    csv = df_keywords.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Download Keywords CSV",
-                        data=csv,
-                        file_name=f"{st.session_state.website_name}_keywords.csv",
-                        mime="text/csv"
-                    )
-            else:
-                st.warning("No keywords extracted")
-        
-        # TAB 4: CONTENT
-        with tab4:
-            st.header("📝 Content Structure")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Heading Distribution")
-                heading_counts = {tag: len(content) for tag, content in headings.items() if content}
-                
-                if heading_counts:
-                    df_headings = pd.DataFrame(list(heading_counts.items()), 
-                                              columns=['Tag', 'Count'])
-                    fig = px.bar(df_headings, x='Tag', y='Count', 
-                                title='Heading Tags Distribution',
-                                color='Count',
-                                color_continuous_scale='Blues')
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("No heading tags found")
-            
-            with col2:
-                st.subheader("H1 Tags")
-                if headings['h1']:
-                    for i, h1 in enumerate(headings['h1'][:10], 1):
-                        st.markdown(f"**{i}.** {h1}")
-                else:
-                    st.warning("⚠️ No H1 tags found (Bad for SEO)")
-            
-            st.markdown("---")
-            
-            # All headings expansion
-            with st.expander("🔍 View All Headings"):
-                for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                    if headings[tag]:
-                        st.markdown(f"### {tag.upper()} Tags ({len(headings[tag])})")
-                        for i, heading in enumerate(headings[tag][:20], 1):
-                            st.text(f"{i}. {heading}")
-                        st.markdown("---")
-        
-        # TAB 5: LINKS & IMAGES
-        with tab5:
-            st.header("🔗 Links & Images Analysis")
-            
-            # Links section
-            st.subheader("Links Analysis")
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("Total Links", len(internal_links) + len(external_links))
-            
-            with col2:
-                st.metric("Internal Links", len(internal_links))
-            
-            with col3:
-                st.metric("External Links", len(external_links))
-            
-            # Links pie chart
-            fig = go.Figure(data=[go.Pie(
-                labels=['Internal Links', 'External Links'],
-                values=[len(internal_links), len(external_links)],
-                hole=.4,
-                marker_colors=['#3498db', '#e74c3c']
-            )])
-            fig.update_layout(title='Link Distribution', height=400)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            st.markdown("---")
-            
-            # Images section
-            st.subheader("🖼️ Image Analysis")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.metric("Total Images", image_data['total'])
-                st.metric("Images with Alt Text", image_data['with_alt'])
-                st.metric("Images without Alt Text", image_data['without_alt'])
-                
-                if image_data['without_alt'] > 0:
-                    st.warning(f"⚠️ {image_data['without_alt']} images missing alt text")
-            
-            with col2:
-                fig = go.Figure(data=[go.Pie(
-                    labels=['With Alt Text', 'Without Alt Text'],
-                    values=[image_data['with_alt'], image_data['without_alt']],
-                    marker_colors=['#2ecc71', '#e74c3c']
-                )])
-                fig.update_layout(title='Image Alt Text Coverage', height=350)
-                st.plotly_chart(fig, use_container_width=True)
-        
-        # TAB 6: RECOMMENDATIONS
-        with tab6:
-            st.header("💡 Recommendations & Action Items")
-            
-            recommendations = []
-            
-            if not (30 <= meta_data['title_length'] <= 60):
-                recommendations.append({
-                    'priority': 'High',
-                    'category': 'SEO',
-                    'issue': 'Title Tag Length',
-                    'recommendation': 'Optimize title tag length to 30-60 characters for better search visibility'
-                })
-            
-            if not (120 <= meta_data['description_length'] <= 160):
-                recommendations.append({
-                    'priority': 'High',
-                    'category': 'SEO',
-                    'issue': 'Meta Description Length',
-                    'recommendation': 'Optimize meta description to 120-160 characters'
-                })
-            
-            if not headings['h1']:
-                recommendations.append({
-                    'priority': 'Critical',
-                    'category': 'Content',
-                    'issue': 'Missing H1 Tags',
-                    'recommendation': 'Add H1 tags to your pages - crucial for SEO'
-                })
-            
-            if image_data['without_alt'] > 0:
-                recommendations.append({
-                    'priority': 'Medium',
-                    'category': 'Accessibility',
-                    'issue': f'{image_data["without_alt"]} Images Without Alt Text',
-                    'recommendation': 'Add descriptive alt text to all images for better SEO and accessibility'
-                })
-            
-            if load_time > 3:
-                recommendations.append({
-                    'priority': 'High',
-                    'category': 'Performance',
-                    'issue': 'Slow Page Load Time',
-                    'recommendation': 'Optimize page load time to under 3 seconds (consider image compression, caching, CDN)'
-                })
-            
-            if not website_url.startswith('https'):
-                recommendations.append({
-                    'priority': 'Critical',
-                    'category': 'Security',
-                    'issue': 'No SSL Certificate',
-                    'recommendation': 'Implement SSL certificate (HTTPS) immediately for security and SEO'
-                })
-            
-            if recommendations:
-                df_rec = pd.DataFrame(recommendations)
-                
-                # Priority filter
-                priority_filter = st.multiselect(
-                    "Filter by Priority",
-                    options=['Critical', 'High', 'Medium', 'Low'],
-                    default=['Critical', 'High', 'Medium', 'Low']
-                )
-                
-                df_filtered = df_rec[df_rec['priority'].isin(priority_filter)]
-                
-                # Display recommendations
-                for idx, row in df_filtered.iterrows():
-                    if row['priority'] == 'Critical':
-                        st.error(f"🚨 **{row['priority']}** - {row['category']}: {row['issue']}")
-                    elif row['priority'] == 'High':
-                        st.warning(f"⚠️ **{row['priority']}** - {row['category']}: {row['issue']}")
-                    else:
-                        st.info(f"ℹ️ **{row['priority']}** - {row['category']}: {row['issue']}")
-                    
-                    st.markdown(f"*Recommendation:* {row['recommendation']}")
-                    st.markdown("---")
-                
-                # Summary
-                st.subheader("Summary")
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    critical = len(df_rec[df_rec['priority'] == 'Critical'])
-                    st.metric("Critical Issues", critical)
-                
-                with col2:
-                    high = len(df_rec[df_rec['priority'] == 'High'])
-                    st.metric("High Priority", high)
-                
-                with col3:
-                    medium = len(df_rec[df_rec['priority'] == 'Medium'])
-                    st.metric("Medium Priority", medium)
-                
-            else:
-                st.success("🎉 Excellent! Your website follows all major SEO best practices!")
-                st.balloons()
+
+    # The analysis lives in session state; the render path never refetches
+    data = st.session_state.analysis_cache.get(analyzed_url)
+    if data:
+        if data['thin_content']:
+            st.warning("⚠️ Page appears empty or JavaScript-rendered - not enough content to analyze")
+            st.stop()
+
+        meta_data = data['meta_data']
+        headings = data['headings']
+        image_data = data['image_data']
+        load_time = data['load_time']
+        checks = data['checks']
+        seo_score = data['seo_score']
+
+
+        # Section selector: unlike st.tabs, only the chosen section's code runs
+        section = st.radio(
+            "View",
+            ["📊 Overview",
+             "🎯 SEO Analysis",
+             "🔑 Keywords",
+             "📝 Content",
+             "🔗 Links & Images",
+             "💡 Recommendations"],
+            horizontal=True,
+            key='active_tab',
+            label_visibility='collapsed'
+        )
+        st.markdown("---")
+
+        if section == "📊 Overview":
+            render_overview(data, checks, seo_score, analyzed_url)
+        elif section == "🎯 SEO Analysis":
+            render_seo_analysis(meta_data, checks, seo_score)
+        elif section == "🔑 Keywords":
+            render_keywords(data['keywords'], st.session_state.website_name)
+        elif section == "📝 Content":
+            render_content(headings, data['heading_counts'])
+        elif section == "🔗 Links & Images":
+            render_links_images(data['internal_link_count'], data['external_link_count'], image_data)
+        elif section == "💡 Recommendations":
+            render_recommendations(meta_data, headings, image_data, load_time, analyzed_url)
+
     
     # Reset button
     st.markdown("---")